@@ -26,6 +26,25 @@ if str(src_dir) not in sys.path:
     sys.path.insert(0, str(src_dir))
 
 from common.paths import get_path
+from common.logger import get_logger
+
+# Status prefix for Solibri execution messages (plain when output is redirected)
+if sys.stdout.isatty():
+    _SOLIBRI_TAG = "\033[1m\033[92m [Solibri Execution] \033[0m"
+else:
+    _SOLIBRI_TAG = " [Solibri Execution] "
+
+# Created on first status message so importing this module stays silent
+_logger = None
+
+
+def _status(state: str) -> None:
+    """Log a Solibri execution status message."""
+    global _logger
+    if _logger is None:
+        _logger = get_logger(__name__)
+    _logger.info("%s %s", _SOLIBRI_TAG, state)
+
 
 class SolibriRegistryManager:
     """
@@ -74,33 +93,49 @@ class SolibriRegistryManager:
         command = f'reg export "HKCU\\{self.REGISTRY_PATH}" "{self.backup_file}" /y'
         os.system(command)
     
-    def read_registry_settings(self) -> Dict[str, str]:
+    def read_registry_settings(self, key=None) -> Dict[str, str]:
         """
         Read current registry values for all settings.
         
+        Args:
+            key: Already-open registry key handle (opened here if None)
+        
         Returns:
             Dictionary of setting names to values
         """
+        if key is not None:
+            self._query_settings(key)
+            return self.settings # type: ignore
+        
         try:
             with winreg.OpenKey(winreg.HKEY_CURRENT_USER, self.REGISTRY_PATH) as key:
-                for setting in self.settings.keys():
-                    try:
-                        value, _ = winreg.QueryValueEx(key, setting)
-                        self.settings[setting] = value
-                    except FileNotFoundError:
-                        self.settings[setting] = None
+                self._query_settings(key)
         except FileNotFoundError:
             print("Registry path not found!")
         
         return self.settings # type: ignore
     
-    def modify_registry(self, new_settings: Dict[str, str]):
+    def _query_settings(self, key):
+        """Query all known settings from an open registry key."""
+        for setting in self.settings.keys():
+            try:
+                value, _ = winreg.QueryValueEx(key, setting)
+                self.settings[setting] = value
+            except FileNotFoundError:
+                self.settings[setting] = None
+    
+    def modify_registry(self, new_settings: Dict[str, str], key=None):
         """
         Modify multiple registry settings.
         
         Args:
             new_settings: Dictionary of setting names to new values
+            key: Already-open registry key handle with KEY_SET_VALUE access (opened here if None)
         """
+        if key is not None:
+            self._set_settings(key, new_settings)
+            return
+        
         try:
             with winreg.OpenKey(
                 winreg.HKEY_CURRENT_USER, 
@@ -108,12 +143,16 @@ class SolibriRegistryManager:
                 0, 
                 winreg.KEY_SET_VALUE
             ) as key:
-                for setting, new_value in new_settings.items():
-                    if setting in self.settings:
-                        winreg.SetValueEx(key, setting, 0, winreg.REG_SZ, str(new_value))
+                self._set_settings(key, new_settings)
         except FileNotFoundError:
             print("Error: Registry path not found!")
     
+    def _set_settings(self, key, new_settings: Dict[str, str]):
+        """Write known settings to an open registry key."""
+        for setting, new_value in new_settings.items():
+            if setting in self.settings:
+                winreg.SetValueEx(key, setting, 0, winreg.REG_SZ, str(new_value))
+    
     def restore_registry(self):
         """Restore registry settings from backup file."""
         if os.path.exists(self.backup_file):
@@ -129,13 +168,23 @@ class SolibriRegistryManager:
         Args:
             new_values: Dictionary of settings to update
         """
-        if not self.check_registry_path():
+        # Open the key once for the whole workflow; a missing key replaces
+        # the separate check_registry_path() probe.
+        try:
+            key = winreg.OpenKey(
+                winreg.HKEY_CURRENT_USER,
+                self.REGISTRY_PATH,
+                0,
+                winreg.KEY_READ | winreg.KEY_SET_VALUE
+            )
+        except FileNotFoundError:
             print("Registry path not found!")
             return
         
-        self.export_registry()
-        self.read_registry_settings()
-        self.modify_registry(new_values)
+        with key:
+            self.export_registry()
+            self.read_registry_settings(key)
+            self.modify_registry(new_values, key)
 
 
 class SolibriExecutor:
@@ -162,12 +211,13 @@ class SolibriExecutor:
             if not os.path.isdir(folder):
                 continue
             
-            for filename in os.listdir(folder):
-                if filename.lower().endswith(ext):
-                    try:
-                        os.remove(os.path.join(folder, filename))
-                    except Exception as e:
-                        print(f"Warning: Could not delete {filename} in {folder}: {e}")
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    if entry.name.lower().endswith(ext):
+                        try:
+                            os.unlink(entry.path)
+                        except Exception as e:
+                            print(f"Warning: Could not delete {entry.name} in {folder}: {e}")
     
     def run_batch(self, batch_file: str) -> bool:
         """
@@ -218,7 +268,7 @@ class SolibriExecutor:
         Args:
             process_name: Name of Solibri executable
         """
-        print(f"\033[1m\033[92m [Solibri Execution] \033[0m running...")
+        _status("running...")
         
         while any(proc.name().lower() == process_name.lower() 
                   for proc in psutil.process_iter()):
@@ -230,6 +280,9 @@ class SolibriManager:
     High-level manager combining registry and execution control.
     """
     
+    # Project root shared by all instances (resolved on first construction)
+    _project_root: Optional[str] = None
+    
     def __init__(self, settings: Optional[Dict[str, str]] = None):
         """
         Initialize Solibri manager.
@@ -239,7 +292,10 @@ class SolibriManager:
             backup_dir: Directory for registry backups
             settings: Default Solibri 3D settings (from env or config)
         """
-        self.project_root = str(get_path("root_dir"))
+        if SolibriManager._project_root is None:
+            SolibriManager._project_root = str(get_path("root_dir"))
+        self.project_root = SolibriManager._project_root
+        self._batch_path: Optional[str] = None
         self.registry_manager = SolibriRegistryManager() # type: ignore
         self.executor = SolibriExecutor() # type: ignore
         
@@ -271,14 +327,10 @@ class SolibriManager:
             Absolute path to batch file
         """
         if relative_path is None:
-            # Use paths.yaml configuration: acc/setup/autorun.bat
-            setup_dir = get_path('acc', 'setup')
-            # Convert to Path if it's not already, then append autorun.bat
-            if isinstance(setup_dir, Path):
-                batch_path = setup_dir / "autorun.bat"
-            else:
-                batch_path = Path(str(setup_dir)) / "autorun.bat"
-            return str(batch_path)
+            # Use paths.yaml configuration: acc/setup/autorun.bat (resolved once per instance)
+            if self._batch_path is None:
+                self._batch_path = str(get_path('acc', 'setup') / "autorun.bat") # type: ignore
+            return self._batch_path
         
         # Fallback: use provided relative_path
         return os.path.join(self.project_root, *relative_path)
@@ -312,12 +364,12 @@ class SolibriManager:
         # Execute batch file
         success = self.executor.run_batch(batch_path)
         
-        print(f"\033[1m\033[92m [Solibri Execution] \033[0m {'started' if success else 'failed'}")
+        _status("started" if success else "failed")
         
         if success:
             # Wait for Solibri to complete
             self.executor.wait_for_solibri_exit()
-            print(f"\033[1m\033[92m [Solibri Execution] \033[0m completed")
+            _status("completed")
         
         return success
     
@@ -13,10 +13,15 @@ Usage:
 """
 
 import os
+import json
+import functools
 import platform
+import threading
 from pathlib import Path
-from typing import Union, Dict, Any
-import yaml
+from typing import Union, Dict, Any, Tuple
+
+# Environment variable used to hand the resolved project root to subprocesses
+PROJECT_ROOT_ENV = 'ACC_RECOMM_PROJECT_ROOT'
 
 
 class PathManager:
@@ -32,30 +37,48 @@ class PathManager:
     """
     
     _instance: 'PathManager | None' = None
-    _initialized: bool = False
+    _init_lock: threading.Lock = threading.Lock()
+    
+    platform: str
+    project_root: Path
+    paths: Dict[str, Any]
     
     def __new__(cls) -> 'PathManager':
-        """Singleton pattern - only one PathManager instance."""
+        """
+        Singleton pattern - only one PathManager instance.
+        
+        State is initialized here exactly once (there is no __init__), so
+        repeated PathManager() calls just return the cached instance.
+        """
         if cls._instance is None:
-            cls._instance = super(PathManager, cls).__new__(cls)
+            with cls._init_lock:
+                # Double-checked so concurrent first calls parse the config only once
+                if cls._instance is None:
+                    instance = super(PathManager, cls).__new__(cls)
+                    instance.platform = platform.system()  # 'Windows', 'Darwin', 'Linux'
+                    instance.project_root = instance._find_project_root()
+                    instance.paths = instance._load_paths()
+                    cls._instance = instance
         return cls._instance
     
-    def __init__(self) -> None:
-        """Initialize path manager (only once)."""
-        if not PathManager._initialized:
-            self.platform: str = platform.system()  # 'Windows', 'Darwin', 'Linux'
-            self.project_root: Path = self._find_project_root()
-            self.paths: Dict[str, Any] = self._load_paths()
-            PathManager._initialized = True
-    
     def _find_project_root(self) -> Path:
         """
         Find project root by looking for pyproject.toml.
         Works from any subdirectory in the project.
         
+        A root passed down by a parent process via the
+        ACC_RECOMM_PROJECT_ROOT environment variable is used if it contains
+        config/paths.yaml; otherwise the directory walk below applies.
+        
         Returns:
             Path: Absolute path to project root
         """
+        root_env = os.environ.get(PROJECT_ROOT_ENV)
+        if root_env:
+            root_from_env = Path(root_env)
+            if (root_from_env / 'config' / 'paths.yaml').is_file():
+                return root_from_env
+        
         current = Path(__file__).resolve()
         
         # Walk up the directory tree
@@ -70,6 +93,9 @@ class PathManager:
         """
         Load path configuration from config/paths.yaml.
         
+        The parsed YAML is cached as JSON in config/.paths.cache.json, keyed
+        by the YAML file's mtime, so later processes skip YAML parsing.
+        
         Returns:
             Dict: Nested dictionary of path configurations
             
@@ -77,15 +103,41 @@ class PathManager:
             FileNotFoundError: If paths.yaml doesn't exist
         """
         config_path = self.project_root / 'config' / 'paths.yaml'
+        cache_path = config_path.with_name('.paths.cache.json')
         
-        if not config_path.exists():
+        try:
+            yaml_mtime = config_path.stat().st_mtime_ns
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Path configuration not found: {config_path}\n"
                 f"Please create config/paths.yaml in your project root."
             )
         
+        # Fast path: JSON cache written from the same paths.yaml revision
+        try:
+            cached = json.loads(cache_path.read_bytes())
+            if cached.get('mtime_ns') == yaml_mtime:
+                return cached['data']
+        except (OSError, ValueError, AttributeError, KeyError):
+            pass
+        
+        # Imported lazily so processes served from the cache never load PyYAML
+        import yaml
+        
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         with open(config_path, 'r', encoding='utf-8') as f:
-            paths_config = yaml.safe_load(f)
+            paths_config = yaml.load(f, Loader=loader)
+        
+        # Write the cache atomically; failing to cache is not an error
+        tmp_path = cache_path.with_name(f'{cache_path.name}.{os.getpid()}.tmp')
+        try:
+            tmp_path.write_text(
+                json.dumps({'mtime_ns': yaml_mtime, 'data': paths_config}),
+                encoding='utf-8'
+            )
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            tmp_path.unlink(missing_ok=True)
         
         return paths_config
     
@@ -114,6 +166,21 @@ class PathManager:
             data_paths = pm.get('data', 'processed')
             # Returns: {'graphs': Path(...), 'rkg': Path(...), ...}
         """
+        result = self._get_cached(keys)
+        
+        # Hand out a copy of cached dictionaries so callers cannot alter the cache
+        if isinstance(result, dict):
+            return dict(result)
+        return result
+    
+    @functools.lru_cache(maxsize=256)
+    def _get_cached(self, keys: Tuple[str, ...]) -> Union[Path, Dict[str, Path]]:
+        """
+        Resolve a key tuple to Path object(s), memoized per key tuple.
+        
+        Repeated lookups reuse the same Path objects instead of walking the
+        configuration and constructing new paths on every call.
+        """
         result: Any = self.paths
         
         # Navigate through nested dictionary
@@ -198,8 +265,18 @@ class PathManager:
         )
 
 
-# Global singleton instance
-pm = PathManager()
+def __getattr__(name: str) -> Any:
+    """
+    Create the global ``pm`` singleton on first access (PEP 562).
+    
+    Importing this module does not load the path configuration; it is
+    loaded the first time ``pm`` or one of the helpers below is used.
+    """
+    if name == 'pm':
+        global pm
+        pm = PathManager()
+        return pm
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # Convenience functions for easy importing
@@ -211,7 +288,7 @@ def get_path(*keys: str) -> Union[Path, Dict[str, Path]]:
         from common.paths import get_path
         rkg_dir = get_path('data', 'processed', 'rkg')
     """
-    return pm.get(*keys)
+    return PathManager().get(*keys)
 
 
 def get_project_root() -> Path:
@@ -222,4 +299,4 @@ def get_project_root() -> Path:
         from common.paths import get_project_root
         root = get_project_root()
     """
-    return pm.project_root
\ No newline at end of file
+    return PathManager().project_root
\ No newline at end of file
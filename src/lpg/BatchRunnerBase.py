@@ -0,0 +1,144 @@
+"""
+BatchRunnerBase.py
+------------------
+Shared implementation of the Revit Batch Processor runners.
+Writes the batch configuration (model list + settings) and runs BatchRvt.exe.
+"""
+
+from pathlib import Path
+import os
+import subprocess
+import json
+import sys
+from typing import Optional
+
+# Add src directory to Python path for imports
+src_dir = Path(__file__).parent.parent
+if str(src_dir) not in sys.path:
+    sys.path.insert(0, str(src_dir))
+
+from common.paths import get_path, get_project_root, PROJECT_ROOT_ENV
+
+class BatchRunnerBase:
+
+    # BatchRvt.exe location, set once its existence has been verified
+    _exe_path_ok: Optional[Path] = None
+
+    def __init__(self, config_dir=None, rvt_models_dir=None):
+        """
+        Initializes the batch runner.
+
+        Parameters:
+            config_dir (str or Path): Directory containing batch configuration files (defaults to config/rvt).
+            rvt_models_dir (str or Path): Directory containing .rvt model files (see _default_rvt_models_dir).
+        """
+
+        config_dir = Path(config_dir) if config_dir else None
+        if BatchRunnerBase._exe_path_ok is None:
+            default_exe_path = Path.home() / "AppData/Local/RevitBatchProcessor/BatchRvt.exe"
+            if not default_exe_path.exists():
+                raise FileNotFoundError("BatchRvt.exe not found at {}".format(default_exe_path))
+            BatchRunnerBase._exe_path_ok = default_exe_path
+        self.exe_path = BatchRunnerBase._exe_path_ok
+
+        self.settings_file = ''
+        self._update_configuration(config_rvt_batch_dir=config_dir, rvt_models_dir=rvt_models_dir)
+
+    def _default_rvt_models_dir(self):
+        """Directory of .rvt models used when none is given. Override in subclasses if needed."""
+        return get_path('data', 'bim_models')
+
+    def _update_configuration(self, config_rvt_batch_dir=None, rvt_models_dir=None):
+        """
+        Updates the configuration files for Revit batch processing.
+
+        Parameters:
+            config_rvt_batch_dir (Path): Directory containing batch configuration files
+            rvt_models_dir (Path): Directory containing .rvt model files
+        """
+        if config_rvt_batch_dir is None:
+            config_rvt_batch_dir = get_path('config', 'rvt')
+        if rvt_models_dir is None:
+            rvt_models_dir = self._default_rvt_models_dir()
+
+        # Create directory if it doesn't exist
+        config_rvt_batch_dir = Path(config_rvt_batch_dir) # type: ignore
+        config_rvt_batch_dir.mkdir(parents=True, exist_ok=True)
+
+        rvt_batch_setting_file = os.path.join(config_rvt_batch_dir, "RvtBatch.Settings.json")
+        self.settings_file = rvt_batch_setting_file
+
+        rvt_batch_list_file = os.path.join(config_rvt_batch_dir, "RvtBatch.txt")
+        rvt_script_file = os.path.join(config_rvt_batch_dir, "RvtBatch.py")
+
+        # Collect .rvt models before touching RvtBatch.txt; a missing
+        # directory means no models, as with the previous glob
+        # (normcase matches glob's case handling: insensitive on Windows only)
+        try:
+            with os.scandir(rvt_models_dir) as entries:
+                rvt_model_paths = [
+                    os.path.abspath(entry.path)
+                    for entry in entries
+                    if entry.is_file() and os.path.normcase(entry.name).endswith(".rvt")
+                ]
+        except (FileNotFoundError, NotADirectoryError):
+            rvt_model_paths = []
+
+        # Write the list of .rvt files to RvtBatch.txt
+        with open(rvt_batch_list_file, 'w', encoding='utf-8') as f:
+            if rvt_model_paths:
+                f.write("\n".join(rvt_model_paths) + "\n")
+
+        # Update the JSON settings file
+        original_settings = None
+        if os.path.exists(rvt_batch_setting_file):
+            with open(rvt_batch_setting_file, 'r', encoding='utf-8') as f:
+                original_settings = json.load(f)
+            settings = dict(original_settings)
+        else:
+            # Create default settings if file doesn't exist
+            settings = {}
+
+        # Check if files exist before updating paths
+        if os.path.exists(rvt_batch_list_file):
+            settings["revitFileListFilePath"] = os.path.abspath(rvt_batch_list_file)
+
+        if os.path.exists(rvt_script_file):
+            settings["taskScriptFilePath"] = os.path.abspath(rvt_script_file)
+
+        # Write the updated settings back to the file (only if something changed)
+        if settings != original_settings:
+            with open(rvt_batch_setting_file, 'w', encoding='utf-8') as f:
+                json.dump(settings, f, indent=2, ensure_ascii=False)
+
+    def run(self, verbose=True):
+        """
+        Runs BatchRvt.exe with the specified settings file.
+
+        Parameters:
+            verbose (bool): Whether to print output (default: True).
+        """
+        command = [
+            str(self.exe_path),
+            "--settings_file",
+            str(self.settings_file)
+        ]
+
+        # Pass the known project root on so child processes skip the lookup
+        env = {**os.environ, PROJECT_ROOT_ENV: str(get_project_root())}
+
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=not verbose,
+                text=True,
+                check=True,
+                env=env
+            )
+            if verbose:
+                print(result.stdout)
+        except subprocess.CalledProcessError as e:
+            print("[ERROR] BatchRvt.exe failed.")
+            if e.stderr:
+                print(e.stderr)
+            raise
@@ -1,14 +1,14 @@
 # src/utils/cli_utils.py
 # Simplified CLI helpers with minimal colors and rich progress bars.
 
+import os
 import sys
+import time
+import importlib.util
 from typing import Optional, Iterable, Iterator, TypeVar, TextIO
 
-try:
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
-    RICH_AVAILABLE = True
-except ImportError:
-    RICH_AVAILABLE = False
+# rich itself is imported only when a progress bar is actually created
+RICH_AVAILABLE: bool = importlib.util.find_spec("rich") is not None
 
 T = TypeVar("T")
 
@@ -26,58 +26,116 @@ GRAY = "\033[90m"      # Muted text
 _COLOR_ENABLED: bool = True
 
 
-def set_color_enabled(enabled: bool) -> None:
-    """Globally enable/disable colored output."""
-    global _COLOR_ENABLED
-    _COLOR_ENABLED = enabled
+# Message prefixes built once at import: (colored, plain), indexed by `not _COLOR_ENABLED`
+_PREFIX_INFO = (f"{BLUE}[INFO]{RESET} ", "[INFO] ")
+_PREFIX_SUCCESS = (f"{GREEN}[OK]{RESET} ", "[OK] ")
+_PREFIX_WARNING = (f"{YELLOW}[WARN]{RESET} ", "[WARN] ")
+_PREFIX_ERROR = (f"{RED}[ERROR]{RESET} ", "[ERROR] ")
 
 
-def _colorize(text: str, color: str) -> str:
-    """Return text wrapped with ANSI color if enabled."""
-    if not _COLOR_ENABLED:
-        return text
+def _colorize_on(text: str, color: str) -> str:
+    """Return text wrapped with ANSI color."""
     return f"{color}{text}{RESET}"
 
 
+def _colorize_off(text: str, color: str) -> str:
+    """Return text unchanged (colors disabled)."""
+    return text
+
+
+# Swapped by set_color_enabled() so the hot path has no enabled-check
+_colorize = _colorize_on
+
+
+def set_color_enabled(enabled: bool) -> None:
+    """Globally enable/disable colored output."""
+    global _COLOR_ENABLED, _colorize
+    _COLOR_ENABLED = enabled
+    _colorize = _colorize_on if enabled else _colorize_off
+
+
 # ===== Simple colored prints =====
+# Messages are left to the stream's own buffering (line-buffered on a TTY);
+# pass flush=True where output must appear immediately.
 
-def print_info(msg: str, stream: TextIO = sys.stdout) -> None:
+def print_info(msg: str, stream: TextIO = sys.stdout, flush: bool = False) -> None:
     """Print blue [INFO] message."""
-    stream.write(f"{_colorize('[INFO]', BLUE)} {msg}\n")
-    stream.flush()
+    stream.write(f"{_PREFIX_INFO[not _COLOR_ENABLED]}{msg}\n")
+    if flush:
+        stream.flush()
 
 
-def print_success(msg: str, stream: TextIO = sys.stdout) -> None:
+def print_success(msg: str, stream: TextIO = sys.stdout, flush: bool = False) -> None:
     """Print green [OK] message."""
-    stream.write(f"{_colorize('[OK]', GREEN)} {msg}\n")
-    stream.flush()
+    stream.write(f"{_PREFIX_SUCCESS[not _COLOR_ENABLED]}{msg}\n")
+    if flush:
+        stream.flush()
 
 
-def print_warning(msg: str, stream: TextIO = sys.stdout) -> None:
+def print_warning(msg: str, stream: TextIO = sys.stdout, flush: bool = False) -> None:
     """Print yellow [WARN] message."""
-    stream.write(f"{_colorize('[WARN]', YELLOW)} {msg}\n")
-    stream.flush()
+    stream.write(f"{_PREFIX_WARNING[not _COLOR_ENABLED]}{msg}\n")
+    if flush:
+        stream.flush()
 
 
-def print_error(msg: str, stream: TextIO = sys.stderr) -> None:
+def print_error(msg: str, stream: TextIO = sys.stderr, flush: bool = False) -> None:
     """Print red [ERROR] message."""
-    stream.write(f"{_colorize('[ERROR]', RED)} {msg}\n")
-    stream.flush()
+    stream.write(f"{_PREFIX_ERROR[not _COLOR_ENABLED]}{msg}\n")
+    if flush:
+        stream.flush()
 
 
-def print_dim(msg: str, stream: TextIO = sys.stdout) -> None:
+def print_dim(msg: str, stream: TextIO = sys.stdout, flush: bool = False) -> None:
     """Print dimmed/gray message (for less important info)."""
     stream.write(f"{_colorize(msg, GRAY)}\n")
-    stream.flush()
+    if flush:
+        stream.flush()
+
+
+def flush_logs() -> None:
+    """Flush buffered stdout/stderr output."""
+    sys.stdout.flush()
+    sys.stderr.flush()
 
 
 # ===== Progress Bar using rich =====
 
+# Progress advances are batched: forwarded to rich every `update_every` items
+# (auto: ~200 refreshes per bar) or at least every _REFRESH_INTERVAL seconds.
+_REFRESH_INTERVAL = 0.1
+
+# Progress bars are only drawn on an interactive stdout (ACC_FORCE_PROGRESS=1 overrides)
+_PROGRESS_ENABLED: bool = sys.stdout.isatty() or os.environ.get("ACC_FORCE_PROGRESS") == "1"
+
+# Loops with fewer items than this run without a bar (setup cost outweighs the work)
+_MIN_PROGRESS_TOTAL = 32
+
+
+def _new_progress():
+    """Create a transient rich progress bar (imports rich on first use)."""
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
+    return Progress(
+        SpinnerColumn(),
+        TextColumn("[bold blue]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeRemainingColumn(),
+        transient=True  # Progress bar disappears when done
+    )
+
+
+def _auto_update_every(total: int) -> int:
+    """Number of items per progress refresh so a bar gets ~200 updates."""
+    return max(1, total // 200)
+
+
 def progress_iter(
     iterable: Iterable[T],
     total: Optional[int] = None,
     desc: str = "Processing",
-    disable: bool = False
+    disable: bool = False,
+    update_every: int = 0
 ) -> Iterator[T]:
     """
     Wrap an iterable with a progress bar (uses rich if available).
@@ -87,12 +145,13 @@ def progress_iter(
         total: Total count (auto-detected if iterable has __len__)
         desc: Description text
         disable: Set to True to disable progress bar
+        update_every: Items per bar refresh (0 = auto, ~200 refreshes in total)
     
     Example:
         for item in progress_iter(data, desc="Loading"):
             process(item)
     """
-    if disable or not RICH_AVAILABLE:
+    if disable or not RICH_AVAILABLE or not _PROGRESS_ENABLED:
         # Fallback: just iterate without progress
         for x in iterable:
             yield x
@@ -107,18 +166,25 @@ def progress_iter(
                 yield x
             return
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[bold blue]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeRemainingColumn(),
-        transient=True  # Progress bar disappears when done
-    ) as progress:
+    if total < _MIN_PROGRESS_TOTAL:
+        yield from iterable
+        return
+    
+    with _new_progress() as progress:
         task = progress.add_task(desc, total=total)
+        if update_every <= 0:
+            update_every = _auto_update_every(total)
+        pending = 0
+        last = time.monotonic()
         for x in iterable:
             yield x
-            progress.update(task, advance=1)
+            pending += 1
+            if pending >= update_every or time.monotonic() - last >= _REFRESH_INTERVAL:
+                progress.update(task, advance=pending)
+                pending = 0
+                last = time.monotonic()
+        if pending:
+            progress.update(task, advance=pending)
 
 
 class ProgressContext:
@@ -132,40 +198,61 @@ class ProgressContext:
                 progress.update(1)
     """
     
-    def __init__(self, total: int, desc: str = "Processing", disable: bool = False):
+    def __init__(
+        self,
+        total: int,
+        desc: str = "Processing",
+        disable: bool = False,
+        update_every: int = 0
+    ):
         self.total = total
         self.desc = desc
         self.disable = disable
+        self.update_every = update_every if update_every > 0 else _auto_update_every(total)
         self._progress = None
         self._task = None
+        self._active = False  # True while a rich bar is shown
+        self._pending = 0
+        self._last = 0.0
     
     def __enter__(self):
-        if not self.disable and RICH_AVAILABLE:
-            self._progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[bold blue]{task.description}"),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                transient=True
-            )
+        # Without a bar (disabled, tiny total, no rich/TTY) update() and set_description() are no-ops
+        if (not self.disable and RICH_AVAILABLE and _PROGRESS_ENABLED
+                and self.total >= _MIN_PROGRESS_TOTAL):
+            self._progress = _new_progress()
             self._progress.__enter__()
             self._task = self._progress.add_task(self.desc, total=self.total)
+            self._active = True
+            self._last = time.monotonic()
         return self
     
     def __exit__(self, *args):
         if self._progress:
+            self._flush()
+            self._active = False
             self._progress.__exit__(*args)
     
+    def _flush(self) -> None:
+        """Forward buffered advances to rich (records the samples used for the ETA)."""
+        if self._pending:
+            self._progress.update(self._task, advance=self._pending)  # type: ignore[union-attr]
+            self._pending = 0
+            self._last = time.monotonic()
+    
     def update(self, advance: int = 1) -> None:
-        """Advance progress by specified amount."""
-        if self._progress and self._task is not None:
-            self._progress.update(self._task, advance=advance)
+        """Advance progress by specified amount (refreshes are batched)."""
+        if not self._active:
+            return
+        self._pending += advance
+        if (self._pending >= self.update_every
+                or time.monotonic() - self._last >= _REFRESH_INTERVAL):
+            self._flush()
     
     def set_description(self, desc: str) -> None:
         """Update the progress description."""
-        if self._progress and self._task is not None:
-            self._progress.update(self._task, description=desc)
+        if self._active:
+            self._flush()
+            self._progress.update(self._task, description=desc)  # type: ignore[union-attr]
 
 
 # ===== Installation check =====
@@ -183,8 +270,6 @@ def suggest_rich_install() -> None:
 
 # ===== Example usage =====
 if __name__ == "__main__":
-    import time
-    
     # Test colored prints
     print_info("Starting application...")
     print_dim("Debug: Initializing components")
@@ -198,11 +283,11 @@ if __name__ == "__main__":
         time.sleep(0.02)
     
     print("\n--- Testing ProgressContext ---")
-    with ProgressContext(total=30, desc="Processing items") as progress:
-        for i in range(30):
+    with ProgressContext(total=60, desc="Processing items") as progress:
+        for i in range(60):
             time.sleep(0.03)
             progress.update(1)
-            if i == 15:
+            if i == 30:
                 progress.set_description("Processing items (halfway!)")
     
     print_success("All tests completed!")
@@ -3,21 +3,36 @@
 
 import sys
 import os
-import platform
+import functools
+import re
+import time
 import importlib
-from datetime import datetime
+from collections import deque
 from pathlib import Path
 
+# Flush print_tree output once this many characters have accumulated
+_TREE_WRITE_CHUNK = 64 * 1024
+
+@functools.lru_cache(maxsize=None)
+def _get_sys_tuple():
+    """Return (system, release, machine), queried once per process."""
+    if sys.platform.startswith("win"):
+        v = sys.getwindowsversion()
+        return "Windows", "{}.{}.{}".format(v.major, v.minor, v.build), os.environ.get("PROCESSOR_ARCHITECTURE", "")
+    u = os.uname()
+    return u.sysname, u.release, u.machine
+
 def show_system_info():
     """Display basic system and Python environment info."""
     
+    system, release, machine = _get_sys_tuple()
     print("\n🖥️  System Information:")
-    print("  - Platform:      {}".format(platform.system()))
-    print("  - Release:       {}".format(platform.release()))
-    print("  - Python:        {}".format(sys.version.split()[0]))
-    print("  - Architecture:  {}".format(platform.machine()))
+    print("  - Platform:      {}".format(system))
+    print("  - Release:       {}".format(release))
+    print("  - Python:        {}".format("{}.{}.{}".format(*sys.version_info[:3])))
+    print("  - Architecture:  {}".format(machine))
     print("  - Working dir:   {}".format(os.getcwd()))
-    print("  - Time:          {}".format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")))
+    print("  - Time:          {}".format(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())))
 
 def print_tree(root=".", max_depth=2, ignore_names=None, ignore_ext=None, show_hidden=False):
     """
@@ -38,43 +53,74 @@ def print_tree(root=".", max_depth=2, ignore_names=None, ignore_ext=None, show_h
 
     root_path = Path(root).resolve()
 
-    def _is_ignored(p):
-        name = p.name
+    # Ignored names are matched with one compiled alternation
+    ignore_names_re = (
+        re.compile("|".join(re.escape(n) for n in ignore_names)) if ignore_names else None
+    )
+
+    def _suffix(name):
+        # Same rule as Path.suffix: last dot, not leading, not trailing
+        i = name.rfind(".")
+        return name[i:] if 0 < i < len(name) - 1 else ""
 
+    def _is_ignored(name, is_dir):
         # hide dotfiles / dotdirs unless allowed
-        if not show_hidden and name.startswith("."):
+        if not show_hidden and name[0] == ".":
             return True
 
         # exact name match
-        if name in ignore_names:
+        if ignore_names_re is not None and ignore_names_re.fullmatch(name):
             return True
 
         # extension-based ignore (always uses dot-based suffix)
-        if p.is_file() and p.suffix in ignore_ext:
+        if not is_dir and _suffix(name) in ignore_ext:
             return True
 
         return False
 
     def _list_entries(path):
+        # scandir reports the entry type from the directory listing itself,
+        # so no extra stat() is needed per entry
         try:
-            entries = list(path.iterdir())
+            with os.scandir(path) as it:
+                entries = [(e.name, e.path, e.is_dir()) for e in it]
         except PermissionError:
             entries = []
-        entries.sort(key=lambda q: (not q.is_dir(), q.name.lower()))
+        entries.sort(key=lambda q: (not q[2], q[0].lower()))
         return entries
 
-    def _print_dir(path, prefix, depth):
+    def _push_children(stack, path, prefix, depth):
+        # pushed in reverse so entries pop (and print) in sorted order
         if depth > max_depth:
             return
-        entries = [e for e in _list_entries(path) if not _is_ignored(e)]
+        entries = [e for e in _list_entries(path) if not _is_ignored(e[0], e[2])]
         count = len(entries)
-        for i, entry in enumerate(entries):
-            connector = "└── " if i == count - 1 else "├── "
-            display = entry.name + ("/" if entry.is_dir() else "")
-            print("{}{}{}".format(prefix, connector, display))
-            if entry.is_dir() and depth < max_depth:
-                extension = "    " if i == count - 1 else "│   "
-                _print_dir(entry, prefix + extension, depth + 1)
+        for i in range(count - 1, -1, -1):
+            stack.append((entries[i], prefix, i == count - 1, depth))
+
+    def _print_dir(path, prefix, depth):
+        # iterative depth-first walk (no recursion per directory level);
+        # lines are buffered and written in segments of ~64 KB
+        lines = []
+        buffered = 0
+        stack = deque()
+        _push_children(stack, path, prefix, depth)
+        while stack:
+            (name, entry_path, is_dir), prefix, is_last, depth = stack.pop()
+            connector = "└── " if is_last else "├── "
+            line = "".join([prefix, connector, name, "/" if is_dir else ""])
+            lines.append(line)
+            buffered += len(line) + 1
+            if buffered >= _TREE_WRITE_CHUNK:
+                sys.stdout.write("\n".join(lines) + "\n")
+                lines = []
+                buffered = 0
+            if is_dir and depth < max_depth:
+                extension = "    " if is_last else "│   "
+                _push_children(stack, entry_path, prefix + extension, depth + 1)
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
 
     print("\n📂 Project Tree (root='{}', depth={}):".format(str(root_path), max_depth))
     print(root_path.name + "/")
@@ -2,8 +2,9 @@
 Simple time measurement decorator with colored output.
 """
 
+import os
+import sys
 import time
-import functools
 from typing import Callable, TypeVar, Any, cast
 from pathlib import Path
 
@@ -15,27 +16,42 @@ COLOR_BLUE = "\033[94m"
 COLOR_YELLOW = "\033[93m"
 COLOR_RESET = "\033[0m"
 
+# Runtime measurement can be switched off with ACC_PROFILE=0 (read once at import)
+_ENABLED = os.environ.get("ACC_PROFILE", "1") != "0"
+
 def measure_runtime(func: Callable[..., T]) -> Callable[..., T]:
     """
     Decorator that measures and prints the execution time of a function,
     including the source file where it is defined.
+
+    When disabled via ACC_PROFILE=0, the function is returned undecorated.
     """
-    @functools.wraps(func)
+    if not _ENABLED:
+        return func
+
+    # Everything except the elapsed time is fixed at decoration time
+    filename = Path(func.__code__.co_filename).name
+    prefix = "Function {}'{}'{} in file {}'{}'{} completed in {}".format(
+        COLOR_YELLOW, func.__name__, COLOR_RESET,
+        COLOR_BLUE, filename, COLOR_RESET,
+        COLOR_GREEN
+    )
+    suffix = "{} seconds\n".format(COLOR_RESET)
+
     def wrapper(*args: Any, **kwargs: Any) -> T:
-        start_time = time.perf_counter()
+        start_time = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        elapsed = time.perf_counter() - start_time
+        elapsed_ns = time.perf_counter_ns() - start_time
 
-        filename = Path(func.__code__.co_filename).name
-
-        print(
-            "Function {}'{}'{} in file {}'{}'{} completed in {}{:.2f}{} seconds".format(
-                COLOR_YELLOW, func.__name__, COLOR_RESET,
-                COLOR_BLUE, filename, COLOR_RESET,
-                COLOR_GREEN, elapsed, COLOR_RESET
-            )
-        )
+        sys.stdout.write(f"{prefix}{elapsed_ns / 1e9:.2f}{suffix}")
 
         return result
 
+    # Copy only the identifying attributes (cheaper than functools.wraps)
+    wrapper.__name__ = func.__name__
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
+    wrapper.__module__ = func.__module__
+    wrapper.__wrapped__ = func  # type: ignore[attr-defined]
+
     return cast(Callable[..., T], wrapper)